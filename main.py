@@ -1,12 +1,21 @@
+import os
 import sys
 import random
-import heapq
+import threading
+from array import array
+from collections import deque
 from typing import List, Optional, Tuple, Dict
 
+try:
+    from numba import njit  # optional: JIT für den Suchkern
+except ImportError:
+    njit = None
+
 from PySide6.QtCore import (
-    Qt, QRect, QEasingCurve, QPropertyAnimation, QParallelAnimationGroup, QTimer, QSize
+    Qt, QObject, QRect, QEasingCurve, QPropertyAnimation, QParallelAnimationGroup,
+    QSequentialAnimationGroup, QThread, QTimer, QSize, Signal
 )
-from PySide6.QtGui import QFont, QPixmap, QIcon
+from PySide6.QtGui import QFont, QImage, QPixmap, QIcon
 from PySide6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QLabel, QLineEdit, QMessageBox, QFrame,
@@ -21,22 +30,29 @@ GOAL = [1, 2, 3,
         4, 5, 6,
         7, 8, 0]  # 0 = leer
 
+GOAL_BYTES = bytes(GOAL)  # dichte 9-Byte-Form für Vergleiche/Kopien
+
 GOAL_POS = {v: i for i, v in enumerate(GOAL)}
 
+GOAL_RC = {v: divmod(i, 3) for i, v in enumerate(GOAL)}  # Ziel-(Zeile, Spalte) je Tile
+
 def inversions(state: List[int]) -> int:
-    arr = [x for x in state if x != 0]
+    # Ein Durchlauf statt Doppelschleife: Bitmaske der schon gesehenen Werte;
+    # popcount der Bits oberhalb von v zählt die Inversionen mit v als rechtem Partner.
     inv = 0
-    for i in range(len(arr)):
-        for j in range(i + 1, len(arr)):
-            if arr[i] > arr[j]:
-                inv += 1
+    seen = 0
+    for v in state:
+        if v == 0:
+            continue
+        inv += (seen >> (v + 1)).bit_count()
+        seen |= 1 << v
     return inv
 
 def is_solvable_3x3(state: List[int]) -> bool:
     # 3x3: lösbar <=> Inversionen gerade
     return inversions(state) % 2 == 0
 
-def parse_state(text: str) -> Optional[List[int]]:
+def parse_state(text: str) -> Optional[bytearray]:
     """
     Erlaubt:
       "1 2 3 4 5 6 7 8 0"
@@ -47,8 +63,16 @@ def parse_state(text: str) -> Optional[List[int]]:
     if not t:
         return None
 
-    if all(ch.isdigit() for ch in t) and len(t) == 9:
-        vals = [int(ch) for ch in t]
+    if len(t) == 9 and t.isascii() and t.isdigit():
+        # Schnellpfad Kompaktform: Bitmaske prüft "jede Ziffer 0-8 genau
+        # einmal" ohne sort/Vergleichslisten
+        mask = 0
+        vals = bytearray(9)
+        for i, ch in enumerate(t):
+            d = ord(ch) - 48
+            mask |= 1 << d
+            vals[i] = d
+        return vals if mask == 0x1FF else None
     else:
         for sep in [",", ";"]:
             t = t.replace(sep, " ")
@@ -62,7 +86,7 @@ def parse_state(text: str) -> Optional[List[int]]:
 
     if sorted(vals) != list(range(9)):
         return None
-    return vals
+    return bytearray(vals)
 
 def neighbors(index: int) -> List[int]:
     r, c = divmod(index, 3)
@@ -73,6 +97,22 @@ def neighbors(index: int) -> List[int]:
     if c < 2: out.append(index + 1)
     return out
 
+# Nachbarfelder einmalig vorberechnen (Brett ist fix 3×3)
+NEIGHBORS: Tuple[Tuple[int, ...], ...] = tuple(tuple(neighbors(i)) for i in range(9))
+
+# MDELTA[v][src][dst] = Änderung der Manhattan-Distanz, wenn Tile v von src nach dst zieht
+MDELTA: Tuple[Tuple[Tuple[int, ...], ...], ...] = tuple(
+    tuple(
+        tuple(
+            (abs(dst // 3 - GOAL_RC[v][0]) + abs(dst % 3 - GOAL_RC[v][1]))
+            - (abs(src // 3 - GOAL_RC[v][0]) + abs(src % 3 - GOAL_RC[v][1]))
+            for dst in range(9)
+        )
+        for src in range(9)
+    )
+    for v in range(9)
+)
+
 def manhattan(state: Tuple[int, ...]) -> int:
     dist = 0
     for i, v in enumerate(state):
@@ -84,62 +124,233 @@ def manhattan(state: Tuple[int, ...]) -> int:
         dist += abs(r1 - r2) + abs(c1 - c2)
     return dist
 
-def astar_solve(start: List[int], max_expansions: int = 250000) -> Optional[List[int]]:
+def pack_state(state: List[int]) -> int:
+    """Packt die 9 Felder als Nibbles (4 Bit pro Feld) in ein einzelnes int."""
+    s = 0
+    for i, v in enumerate(state):
+        s |= v << (4 * i)
+    return s
+
+GOAL_PACKED = pack_state(GOAL)
+
+# Flache int-Listen für den Suchkern (Numba kann Tupel nicht dynamisch indizieren)
+_NB_DEG = [len(t) for t in NEIGHBORS]
+_NB_FLAT = [NEIGHBORS[i][c] if c < len(NEIGHBORS[i]) else 0
+            for i in range(9) for c in range(4)]
+_MDELTA_FLAT = [MDELTA[v][src][dst]
+                for v in range(9) for src in range(9) for dst in range(9)]
+
+def lehmer_rank(s: int) -> int:
+    """Lehmer-Rang (0..362879) der Permutation im gepackten Zustand."""
+    rank = 0
+    for i in range(9):
+        vi = (s >> (4 * i)) & 0xF
+        smaller = 0
+        for j in range(i + 1, 9):
+            if ((s >> (4 * j)) & 0xF) < vi:
+                smaller += 1
+        rank = rank * (9 - i) + smaller
+    return rank
+
+if njit is not None:
+    lehmer_rank = njit(cache=True)(lehmer_rank)
+
+# Pattern-Datenbank: exakte Zugdistanz je Zustand, indiziert per Lehmer-Rang.
+# Wird beim ersten Lösen gebaut und neben dem Skript gecacht (-1 = unlösbar).
+_PDB_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "8puzzle_pdb.bin")
+_pdb: List[int] = []
+
+def _build_pdb() -> List[int]:
+    # Breitensuche rückwärts vom Ziel über alle 181440 erreichbaren Zustände
+    table = [-1] * 362880
+    dist: Dict[int, int] = {GOAL_PACKED: 0}
+    queue = deque([(GOAL_PACKED, GOAL_POS[0], 0)])
+    while queue:
+        s, z, d = queue.popleft()
+        d1 = d + 1
+        for nb in NEIGHBORS[z]:
+            tile = (s >> (4 * nb)) & 0xF
+            ns = s ^ (tile << (4 * nb)) ^ (tile << (4 * z))
+            if ns not in dist:
+                dist[ns] = d1
+                queue.append((ns, nb, d1))
+    for s, d in dist.items():
+        table[lehmer_rank(s)] = d
+    return table
+
+def _get_pdb() -> List[int]:
+    global _pdb
+    if _pdb:
+        return _pdb
+    try:
+        with open(_PDB_FILE, "rb") as fh:
+            raw = array("b")
+            raw.frombytes(fh.read())
+        if len(raw) == 362880:
+            _pdb = list(raw)
+            return _pdb
+    except OSError:
+        pass
+    _pdb = _build_pdb()
+    try:
+        with open(_PDB_FILE, "wb") as fh:
+            fh.write(array("b", _pdb).tobytes())
+    except OSError:
+        pass  # kein Cache möglich -> beim nächsten Start neu bauen
+    return _pdb
+
+def _ida_core(s0: int, zero: int, h0: int, bound: int, budget: int,
+              nb_flat: List[int], nb_deg: List[int], mdelta: List[int],
+              pdb: List[int], path: List[int]) -> Tuple[int, int, int]:
     """
-    Gibt eine Liste der zu bewegenden Tile-Werte zurück (z.B. [8,5,2,...]) oder None.
+    Eine IDA*-Iteration (Tiefensuche bis Schranke `bound`) über gepackte
+    int-Zustände. Heuristik: Pattern-Datenbank (exakt), falls `pdb` gefüllt
+    ist, sonst inkrementelles Manhattan über `mdelta`. Bewusst nur
+    int-Arithmetik und flache Listen, damit die Funktion unverändert per
+    Numba kompilierbar ist.
+    Rückgabe: (status, naechste_schranke, expansions)
+      status >= 0: Lösung gefunden, Länge = status, Züge stehen in path
+      status == -1: Schranke überschritten, naechste_schranke = kleinstes f darüber
+      status == -2: Expansionsbudget aufgebraucht
     """
-    start_t = tuple(start)
-    goal_t = tuple(GOAL)
-    if start_t == goal_t:
-        return []
-
-    open_heap = []
-    g_cost: Dict[Tuple[int, ...], int] = {start_t: 0}
-    parent: Dict[Tuple[int, ...], Tuple[Tuple[int, ...], int]] = {}  # child -> (parent_state, moved_tile)
-
-    heapq.heappush(open_heap, (manhattan(start_t), 0, start_t))
-
     expansions = 0
-    while open_heap:
-        f, g, state = heapq.heappop(open_heap)
-        if g != g_cost.get(state, 10**9):
+    next_bound = 1 << 30
+
+    # explizite Stacks statt Rekursion; Tiefe entspricht g
+    s_stack = [0] * 40
+    z_stack = [0] * 40
+    h_stack = [0] * 40
+    l_stack = [0] * 40  # zuletzt bewegtes Tile je Frame
+    c_stack = [0] * 40  # nächster Kind-Index je Frame
+    m_stack = [0] * 40  # Zug, der in den Frame geführt hat
+    s_stack[0] = s0
+    z_stack[0] = zero
+    h_stack[0] = h0
+
+    depth = 0
+    while depth >= 0:
+        z = z_stack[depth]
+        h = h_stack[depth]
+        c = c_stack[depth]
+        if c == 0:
+            # erster Besuch dieses Frames: Schranken-/Zieltest
+            f = depth + h
+            if f > bound:
+                if f < next_bound:
+                    next_bound = f
+                depth -= 1
+                continue
+            if h == 0:
+                for i in range(depth):
+                    path[i] = m_stack[i + 1]
+                return depth, next_bound, expansions
+            expansions += 1
+            if expansions > budget:
+                return -2, next_bound, expansions
+        if c >= nb_deg[z]:
+            depth -= 1
             continue
+        c_stack[depth] = c + 1
+
+        s = s_stack[depth]
+        nb = nb_flat[z * 4 + c]
+        tile = (s >> (4 * nb)) & 0xF
+        if tile == l_stack[depth]:
+            continue  # den letzten Zug nicht direkt rückgängig machen
+
+        # Zug = Tile-Nibble von nb nach zero verschieben (Leerfeld-Nibble ist 0)
+        depth += 1
+        ns = s ^ (tile << (4 * nb)) ^ (tile << (4 * z))
+        s_stack[depth] = ns
+        z_stack[depth] = nb
+        if len(pdb) > 0:
+            h_stack[depth] = pdb[lehmer_rank(ns)]  # exakte Distanz
+        else:
+            h_stack[depth] = h + mdelta[(tile * 9 + nb) * 9 + z]
+        l_stack[depth] = tile
+        m_stack[depth] = tile
+        c_stack[depth] = 0
 
-        if state == goal_t:
-            moves: List[int] = []
-            cur = state
-            while cur in parent:
-                prev, moved = parent[cur]
-                moves.append(moved)
-                cur = prev
-            moves.reverse()
-            return moves
-
-        expansions += 1
-        if expansions > max_expansions:
-            return None
+    return -1, next_bound, expansions
 
-        z = state.index(0)
-        for nb in neighbors(z):
-            moved_tile = state[nb]
-            new_state = list(state)
-            new_state[z], new_state[nb] = new_state[nb], new_state[z]
-            new_t = tuple(new_state)
+if njit is not None:
+    _ida_core = njit(cache=True)(_ida_core)
 
-            new_g = g + 1
-            if new_g < g_cost.get(new_t, 10**9):
-                g_cost[new_t] = new_g
-                parent[new_t] = (state, moved_tile)
-                new_f = new_g + manhattan(new_t)
-                heapq.heappush(open_heap, (new_f, new_g, new_t))
+def astar_solve(start: List[int], max_expansions: int = 250000,
+                cancel: Optional[threading.Event] = None) -> Optional[List[int]]:
+    """
+    IDA* (iterative Vertiefung mit Manhattan-Schranke, nach Korf).
+    Braucht nur O(Tiefe) Speicher statt Open/Closed-Mengen wie klassisches A*.
+    Über `cancel` kann die Suche zwischen zwei Vertiefungsiterationen
+    abgebrochen werden (liefert dann None).
+    Gibt eine Liste der zu bewegenden Tile-Werte zurück (z.B. [8,5,2,...]) oder None.
+    """
+    s0 = pack_state(start)
+    if s0 == GOAL_PACKED:
+        return []
 
+    pdb = _get_pdb()
+    if pdb:
+        h0 = pdb[lehmer_rank(s0)]
+        if h0 < 0:
+            return None  # unlösbare Ausgangslage
+    else:
+        h0 = manhattan(tuple(start))
+
+    zero = start.index(0)
+    bound = h0
+    budget = max_expansions
+    path = [0] * 40
+    while budget > 0:
+        if cancel is not None and cancel.is_set():
+            return None
+        status, next_bound, used = _ida_core(
+            s0, zero, h0, bound, budget, _NB_FLAT, _NB_DEG, _MDELTA_FLAT, pdb, path
+        )
+        if status >= 0:
+            return path[:status]
+        if status == -2:
+            return None
+        budget -= used
+        bound = next_bound
     return None
 
+# Lösungscache je gepacktem Zustand (z.B. Reset + erneut lösen)
+_solution_cache: Dict[int, Optional[Tuple[int, ...]]] = {}
+
+def _solve_cached(s: int,
+                  cancel: Optional[threading.Event] = None) -> Optional[Tuple[int, ...]]:
+    """Memoisierte Lösungssuche; abgebrochene Suchen werden nicht gecacht."""
+    if s in _solution_cache:
+        return _solution_cache[s]
+    state = [(s >> (4 * i)) & 0xF for i in range(9)]
+    moves = astar_solve(state, cancel=cancel)
+    if moves is None and cancel is not None and cancel.is_set():
+        return None
+    result = None if moves is None else tuple(moves)
+    _solution_cache[s] = result
+    return result
+
 
 # -----------------------------
 # GUI
 # -----------------------------
 
+class SolverWorker(QObject):
+    """Führt die Lösungssuche in einem Hintergrund-QThread aus."""
+
+    finished = Signal(object)  # Liste der Züge oder None
+
+    def __init__(self, state_packed: int, cancel: threading.Event):
+        super().__init__()
+        self._state_packed = state_packed
+        self._cancel = cancel
+
+    def run(self):
+        moves = _solve_cached(self._state_packed, self._cancel)
+        self.finished.emit(None if moves is None else list(moves))
+
+
 class SlidingPuzzle(QWidget):
     TILE = 92
     GAP = 10
@@ -160,14 +371,24 @@ class SlidingPuzzle(QWidget):
         self.resize(self.BASE_SIZE)
         self._base_size = QSize(self.BASE_SIZE)
 
-        self.state: List[int] = GOAL.copy()
-        self.initial_state: List[int] = self.state.copy()
+        self.state: bytearray = bytearray(GOAL_BYTES)
+        self.initial_state: bytearray = self.state.copy()
+        self.pos: Dict[int, int] = {}  # Wert -> Index, spiegelt self.state
+        self._rebuild_pos()
 
         self.tiles: Dict[int, QPushButton] = {}
         self._animating = False
         self._auto_playing = False
-        self._pending_moves: List[int] = []
         self._anim_group: Optional[QParallelAnimationGroup] = None
+        self._single_anim: Optional[QPropertyAnimation] = None
+        self._solve_group: Optional[QSequentialAnimationGroup] = None
+        self._solve_steps: List[Tuple[int, int]] = []  # (Tile-Wert, Ziel-Index) je Zug
+        self._solve_step = 0  # nächster noch nicht angewendeter Zug der Sequenz
+
+        # Hintergrund-Suche
+        self._solver_thread: Optional[QThread] = None
+        self._solver_worker: Optional[SolverWorker] = None
+        self._solver_cancel: Optional[threading.Event] = None
 
         # Bildmodus
         self._image_mode = False
@@ -205,11 +426,27 @@ class SlidingPuzzle(QWidget):
         self.board.setObjectName("board")
         side = self.PAD * 2 + self.TILE * 3 + self.GAP * 2
         self.board.setFixedSize(side, side)
+        # Ein gemeinsames Stylesheet für Board und Tiles; der Tile-Look hängt
+        # an der dynamischen Property "mode" statt an Stylesheets pro Button
         self.board.setStyleSheet("""
             QFrame#board {
                 background: #1f2937;
                 border-radius: 16px;
             }
+            QPushButton#tile[mode="text"] {
+                background: #e5e7eb;
+                border: none;
+                border-radius: 14px;
+            }
+            QPushButton#tile[mode="text"]:hover { background: #f3f4f6; }
+            QPushButton#tile[mode="text"]:pressed { background: #d1d5db; }
+            QPushButton#tile[mode="image"] {
+                background: transparent;
+                border: none;
+                border-radius: 14px;
+            }
+            QPushButton#tile[mode="image"]:hover { background: rgba(255,255,255,0.08); }
+            QPushButton#tile[mode="image"]:pressed { background: rgba(0,0,0,0.10); }
         """)
         left.addWidget(self.board, alignment=Qt.AlignCenter)
 
@@ -218,8 +455,12 @@ class SlidingPuzzle(QWidget):
         left.addLayout(controls)
 
         # Reihe 1: Felder setzen + Eingabe + Setzen + Mischen
-        r1 = QHBoxLayout()
-        controls.addLayout(r1)
+        # (als Container-Widget, damit _set_controls_enabled die ganze Reihe
+        # mit einem setEnabled schalten kann)
+        self._row_input = QWidget()
+        r1 = QHBoxLayout(self._row_input)
+        r1.setContentsMargins(0, 0, 0, 0)
+        controls.addWidget(self._row_input)
 
         r1.addStretch(1)
         r1.addWidget(QLabel("Felder setzen:"))
@@ -260,9 +501,13 @@ class SlidingPuzzle(QWidget):
         r2.addWidget(self.btn_log)
         r2.addStretch(1)
 
-        # Reihe 3: Prüfen + Bild laden + Bild löschen
-        r3 = QHBoxLayout()
-        controls.addLayout(r3)
+        # Reihe 3: Prüfen + Bild laden + Bild löschen (Container wie Reihe 1;
+        # Stop/Log aus Reihe 2 bleiben bewusst außerhalb, sie sollen während
+        # Suche/Playback bedienbar bleiben)
+        self._row_tools = QWidget()
+        r3 = QHBoxLayout(self._row_tools)
+        r3.setContentsMargins(0, 0, 0, 0)
+        controls.addWidget(self._row_tools)
 
         r3.addStretch(1)
         self.btn_check = QPushButton("Prüfen")
@@ -343,15 +588,7 @@ class SlidingPuzzle(QWidget):
             btn.setObjectName("tile")
             btn.setFont(QFont("Arial", 18, QFont.Bold))
             btn.setCursor(Qt.PointingHandCursor)
-            btn.setStyleSheet("""
-                QPushButton#tile {
-                    background: #e5e7eb;
-                    border: none;
-                    border-radius: 14px;
-                }
-                QPushButton#tile:hover { background: #f3f4f6; }
-                QPushButton#tile:pressed { background: #d1d5db; }
-            """)
+            btn.setProperty("mode", "text")
             btn.clicked.connect(lambda checked=False, v=val: self.on_tile_clicked(v))
             self.tiles[val] = btn
 
@@ -369,6 +606,9 @@ class SlidingPuzzle(QWidget):
         self.resize(self._base_size)
         self.log_panel.setVisible(was)
 
+    def _rebuild_pos(self):
+        self.pos = {v: i for i, v in enumerate(self.state)}
+
     def cell_rect(self, index: int) -> QRect:
         r, c = divmod(index, 3)
         x = self.PAD + c * (self.TILE + self.GAP)
@@ -380,21 +620,15 @@ class SlidingPuzzle(QWidget):
         return (r + 1, c + 1)
 
     def _set_controls_enabled(self, enabled: bool):
-        self.input.setEnabled(enabled)
-        self.btn_set.setEnabled(enabled)
-        self.btn_shuffle.setEnabled(enabled)
+        # Container/Board schalten statt 16 Einzel-Buttons: Reihe 1 und 3
+        # komplett, aus Reihe 2 nur Lösen/Reset (Stop/Log bleiben bedienbar),
+        # das Board deckt alle Tile-Buttons ab. btn_img_clear behält sein
+        # eigenes Enabled-Flag (folgt dem Bildmodus) unterhalb des Containers.
+        self._row_input.setEnabled(enabled)
+        self._row_tools.setEnabled(enabled)
         self.btn_solve.setEnabled(enabled)
         self.btn_reset.setEnabled(enabled)
-        self.btn_check.setEnabled(enabled)
-        self.btn_img_load.setEnabled(enabled)
-        self.btn_img_clear.setEnabled(enabled and self._image_mode)
-
-        for b in self.tiles.values():
-            b.setEnabled(enabled)
-
-        # Log toggle darf immer
-        self.btn_log.setEnabled(True)
-        self.btn_log_clear.setEnabled(True)
+        self.board.setEnabled(enabled)
 
     def _log(self, msg: str):
         self.log_text.append(msg)
@@ -466,6 +700,15 @@ class SlidingPuzzle(QWidget):
         inner = self._board_inner_side()
         scaled = sq.scaled(inner, inner, Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
 
+        # Einmal in ein QImage wandeln und die Kacheln als Sichten auf den
+        # gemeinsamen Pixelpuffer ausschneiden statt 8x QPixmap.copy();
+        # kopiert wird erst beim QPixmap.fromImage je Kachel.
+        img = scaled.toImage()
+        if img.format() != QImage.Format_ARGB32:
+            img = img.convertToFormat(QImage.Format_ARGB32)
+        bpl = img.bytesPerLine()
+        buf = img.constBits()
+
         self._tile_images.clear()
         for idx, val in enumerate(GOAL):
             if val == 0:
@@ -473,40 +716,32 @@ class SlidingPuzzle(QWidget):
             r, c = divmod(idx, 3)
             x = c * (self.TILE + self.GAP)
             y = r * (self.TILE + self.GAP)
-            self._tile_images[val] = scaled.copy(x, y, self.TILE, self.TILE)
+            view = QImage(buf[y * bpl + x * 4:], self.TILE, self.TILE,
+                          bpl, QImage.Format_ARGB32)
+            self._tile_images[val] = QPixmap.fromImage(view)
 
     def _apply_tile_appearance(self):
         for val, btn in self.tiles.items():
-            if self._image_mode and val in self._tile_images:
+            as_image = self._image_mode and val in self._tile_images
+            if as_image:
                 btn.setText("")
                 btn.setIcon(QIcon(self._tile_images[val]))
                 btn.setIconSize(QSize(self.TILE, self.TILE))
-                btn.setStyleSheet("""
-                    QPushButton#tile {
-                        background: transparent;
-                        border: none;
-                        border-radius: 14px;
-                    }
-                    QPushButton#tile:hover { background: rgba(255,255,255,0.08); }
-                    QPushButton#tile:pressed { background: rgba(0,0,0,0.10); }
-                """)
             else:
                 btn.setIcon(QIcon())
                 btn.setText(str(val))
-                btn.setStyleSheet("""
-                    QPushButton#tile {
-                        background: #e5e7eb;
-                        border: none;
-                        border-radius: 14px;
-                    }
-                    QPushButton#tile:hover { background: #f3f4f6; }
-                    QPushButton#tile:pressed { background: #d1d5db; }
-                """)
+
+            # nur die Property umschalten; das Stylesheet am Board bleibt stehen
+            mode = "image" if as_image else "text"
+            if btn.property("mode") != mode:
+                btn.setProperty("mode", mode)
+                btn.style().unpolish(btn)
+                btn.style().polish(btn)
 
     # ---------- Rendering / Animation ----------
 
     def _sync_tiles_to_state(self, animate: bool):
-        self.status.setText("✅ Zielzustand erreicht!" if self.state == GOAL else "")
+        self.status.setText("✅ Zielzustand erreicht!" if self.state == GOAL_BYTES else "")
 
         if not animate:
             for idx, val in enumerate(self.state):
@@ -540,38 +775,61 @@ class SlidingPuzzle(QWidget):
 
         def done():
             self._animating = False
-            if not self._auto_playing:
-                self._set_controls_enabled(True)
-            self.status.setText("✅ Zielzustand erreicht!" if self.state == GOAL else "")
+            self._set_controls_enabled(True)
+            self.status.setText("✅ Zielzustand erreicht!" if self.state == GOAL_BYTES else "")
             self._anim_group = None
 
-            if self._auto_playing:
-                QTimer.singleShot(self.PLAYBACK_GAP_MS, self._play_next_move)
-
         if moved_any:
             group.finished.connect(done)
             group.start()
         else:
             done()
 
+    def _animate_single_tile(self, val: int, idx: int):
+        """
+        Schnellpfad für Einzelzüge: animiert genau ein Tile zu Zelle idx,
+        ohne wie _sync_tiles_to_state alle 8 Geometrien zu vergleichen.
+        """
+        self._animating = True
+        self._set_controls_enabled(False)
+
+        btn = self.tiles[val]
+        anim = QPropertyAnimation(btn, b"geometry", self)
+        anim.setDuration(self.ANIM_MS)
+        anim.setEasingCurve(QEasingCurve.OutCubic)
+        anim.setStartValue(btn.geometry())
+        anim.setEndValue(self.cell_rect(idx))
+
+        def done():
+            self._animating = False
+            self._set_controls_enabled(True)
+            self.status.setText("✅ Zielzustand erreicht!" if self.state == GOAL_BYTES else "")
+            self._single_anim = None
+
+        anim.finished.connect(done)
+        self._single_anim = anim
+        anim.start()
+
     # ---------- Moves ----------
 
     def _apply_move_by_tile_value(self, tile_value: int, from_auto: bool):
         if self._animating:
             return
 
-        zero_idx = self.state.index(0)
-        tile_idx = self.state.index(tile_value)
-        if tile_idx not in neighbors(zero_idx):
+        zero_idx = self.pos[0]
+        tile_idx = self.pos[tile_value]
+        if tile_idx not in NEIGHBORS[zero_idx]:
             return
 
         fr = self.idx_to_rc(tile_idx)
         to = self.idx_to_rc(zero_idx)
         self.state[zero_idx], self.state[tile_idx] = self.state[tile_idx], self.state[zero_idx]
+        self.pos[tile_value] = zero_idx
+        self.pos[0] = tile_idx
 
         prefix = "AUTO" if from_auto else "USER"
         self._log(f"[{prefix}] {tile_value}  ({fr[0]},{fr[1]}) -> ({to[0]},{to[1]})")
-        self._sync_tiles_to_state(animate=True)
+        self._animate_single_tile(tile_value, zero_idx)
 
     def on_tile_clicked(self, tile_value: int):
         if self._auto_playing:
@@ -600,55 +858,94 @@ class SlidingPuzzle(QWidget):
 
         self.state = vals
         self.initial_state = vals.copy()
-        self._log(f"--- SET: {self.state} ---")
+        self._rebuild_pos()
+        self._log(f"--- SET: {list(self.state)} ---")
         self._sync_tiles_to_state(animate=True)
 
     def on_reset(self):
         if self._animating or self._auto_playing:
             return
         self.state = self.initial_state.copy()
-        self._log(f"--- RESET: {self.state} ---")
+        self._rebuild_pos()
+        self._log(f"--- RESET: {list(self.state)} ---")
         self._sync_tiles_to_state(animate=True)
 
     def on_check(self):
         QMessageBox.information(
             self, "Check",
-            "✅ Puzzle ist gelöst." if self.state == GOAL else "❌ Noch nicht gelöst."
+            "✅ Puzzle ist gelöst." if self.state == GOAL_BYTES else "❌ Noch nicht gelöst."
         )
 
     def on_shuffle(self):
         if self._animating or self._auto_playing:
             return
 
-        self.state = GOAL.copy()
-        zero_idx = self.state.index(0)
-        last = None
+        # Random Walk über die vorberechnete NEIGHBORS-Tabelle; keine
+        # Listenallokation pro Schritt, kein direkter Rückzug zum vorherigen Feld.
+        st = bytearray(GOAL_BYTES)
+        zero_idx = GOAL_POS[0]
+        last = -1
+        randrange = random.randrange
         for _ in range(80):
-            nbs = neighbors(zero_idx)
-            if last is not None and last in nbs and len(nbs) > 1:
-                nbs.remove(last)
-            nxt = random.choice(nbs)
-            self.state[zero_idx], self.state[nxt] = self.state[nxt], self.state[zero_idx]
+            nbs = NEIGHBORS[zero_idx]
+            if last < 0:
+                nxt = nbs[randrange(len(nbs))]
+            else:
+                # last ist immer Nachbar des Leerfelds: eine Option weniger,
+                # bei Kollision auf das letzte Element ausweichen (bleibt gleichverteilt)
+                nxt = nbs[randrange(len(nbs) - 1)]
+                if nxt == last:
+                    nxt = nbs[-1]
+            st[zero_idx], st[nxt] = st[nxt], st[zero_idx]
             last = zero_idx
             zero_idx = nxt
+        self.state = st
 
         self.initial_state = self.state.copy()
+        self._rebuild_pos()
         self.input.setText(" ".join(map(str, self.state)))
-        self._log(f"--- SHUFFLE: {self.state} ---")
+        self._log(f"--- SHUFFLE: {list(self.state)} ---")
         self._sync_tiles_to_state(animate=True)
 
     def on_solve(self):
-        if self._animating or self._auto_playing:
+        if self._animating or self._auto_playing or self._solver_thread is not None:
             return
 
         if not is_solvable_3x3(self.state):
             QMessageBox.warning(self, "Unlösbar", "Diese Ausgangslage ist unlösbar.")
             return
 
+        # Suche im Hintergrund-Thread; die GUI bleibt bedienbar und
+        # Stop kann die Suche tatsächlich abbrechen.
         self.status.setText("🧠 Suche nach Lösung …")
-        QApplication.processEvents()
+        self._set_controls_enabled(False)
+        self.btn_stop.setEnabled(True)
+
+        self._solver_cancel = threading.Event()
+        self._solver_worker = SolverWorker(pack_state(self.state), self._solver_cancel)
+        self._solver_thread = QThread(self)
+        self._solver_worker.moveToThread(self._solver_thread)
+        self._solver_thread.started.connect(self._solver_worker.run)
+        self._solver_worker.finished.connect(self._on_solver_finished)
+        self._solver_thread.start()
+
+    def _on_solver_finished(self, moves):
+        cancelled = self._solver_cancel is not None and self._solver_cancel.is_set()
+        thread = self._solver_thread
+        self._solver_thread = None
+        self._solver_worker = None
+        self._solver_cancel = None
+        if thread is not None:
+            thread.quit()
+            thread.wait()
+
+        self.btn_stop.setEnabled(False)
+        self._set_controls_enabled(True)
+
+        if cancelled:
+            self.status.setText("⏹️ Suche abgebrochen.")
+            return
 
-        moves = astar_solve(self.state)
         if moves is None:
             QMessageBox.warning(self, "Keine Lösung", "Keine Lösung gefunden (Limit erreicht).")
             self.status.setText("")
@@ -659,38 +956,95 @@ class SlidingPuzzle(QWidget):
             self.status.setText("✅ Zielzustand erreicht!")
             return
 
+        self._start_auto_play(moves)
+
+    def _start_auto_play(self, moves: List[int]):
         self._log(f"--- AUTO SOLVE: {len(moves)} Züge ---")
-        self._pending_moves = moves
         self._auto_playing = True
-
         self.btn_stop.setEnabled(True)
         self._set_controls_enabled(False)
-        self.status.setText(f"▶️ Auto-Lösung läuft … (noch {len(self._pending_moves)} Züge)")
-        self._play_next_move()
 
-    def _play_next_move(self):
-        if not self._auto_playing or self._animating:
+        # Eine durchgehende Animationssequenz statt Timer-Hopser pro Zug:
+        # Zielgeometrien vorab per Simulation des Zustands bestimmen.
+        group = QSequentialAnimationGroup(self)
+        sim = self.state.copy()
+        zero = sim.index(0)
+        self._solve_steps = []
+        for tile in moves:
+            tile_idx = sim.index(tile)
+            sim[zero], sim[tile_idx] = tile, 0
+            self._solve_steps.append((tile, zero))
+
+            anim = QPropertyAnimation(self.tiles[tile], b"geometry")
+            anim.setDuration(self.ANIM_MS)
+            anim.setEasingCurve(QEasingCurve.OutCubic)
+            anim.setEndValue(self.cell_rect(zero))  # Startwert = aktuelle Geometrie
+            group.addAnimation(anim)
+            group.addPause(self.PLAYBACK_GAP_MS)
+            zero = tile_idx
+
+        group.currentAnimationChanged.connect(self._on_solve_step_started)
+        group.finished.connect(self._finish_auto_play)
+        self._solve_group = group
+
+        # Schritt 0 explizit anwenden: die Gruppe macht die erste Animation
+        # schon beim addAnimation() zur aktuellen, d.h. currentAnimationChanged
+        # hat für Index 0 bereits gefeuert und start() wiederholt das nicht.
+        self._solve_step = 0
+        self._apply_solve_step()
+        group.start()
+
+    def _on_solve_step_started(self, current):
+        # feuert beim Start jedes Sequenz-Teils; Pausen (ungerade Indizes) überspringen
+        if self._solve_group is None or current is None:
             return
-
-        if not self._pending_moves:
-            self._auto_playing = False
-            self.btn_stop.setEnabled(False)
-            self._set_controls_enabled(True)
-            self.status.setText("✅ Auto-Lösung fertig!" if self.state == GOAL else "⏹️ Auto-Lösung beendet.")
+        idx = self._solve_group.indexOfAnimation(current)
+        if idx < 0 or idx % 2 != 0:
             return
+        if idx // 2 != self._solve_step:
+            return  # Schritt schon angewendet (z.B. Emission beim Gruppenaufbau)
+        self._apply_solve_step()
 
-        nxt = self._pending_moves.pop(0)
-        self.status.setText(f"▶️ Auto-Lösung läuft … (noch {len(self._pending_moves)} Züge)")
-        self._apply_move_by_tile_value(nxt, from_auto=True)
+    def _apply_solve_step(self):
+        step = self._solve_step
+        tile, _ = self._solve_steps[step]
+
+        zero_idx = self.pos[0]
+        tile_idx = self.pos[tile]
+        fr = self.idx_to_rc(tile_idx)
+        to = self.idx_to_rc(zero_idx)
+        self.state[zero_idx], self.state[tile_idx] = tile, 0
+        self.pos[tile] = zero_idx
+        self.pos[0] = tile_idx
+        self._solve_step = step + 1
+
+        self._log(f"[AUTO] {tile}  ({fr[0]},{fr[1]}) -> ({to[0]},{to[1]})")
+        self.status.setText(f"▶️ Auto-Lösung läuft … (noch {len(self._solve_steps) - step - 1} Züge)")
+
+    def _finish_auto_play(self):
+        if not self._auto_playing:
+            return
+        self._auto_playing = False
+        self._solve_group = None
+        self.btn_stop.setEnabled(False)
+        self._set_controls_enabled(True)
+        self._sync_tiles_to_state(animate=False)
+        self.status.setText("✅ Auto-Lösung fertig!" if self.state == GOAL_BYTES else "⏹️ Auto-Lösung beendet.")
 
     def on_stop(self):
+        if self._solver_cancel is not None:
+            # laufende Suche abbrechen; Aufräumen übernimmt _on_solver_finished
+            self._solver_cancel.set()
+            return
         if not self._auto_playing:
             return
         self._auto_playing = False
-        self._pending_moves = []
+        if self._solve_group is not None:
+            self._solve_group.stop()
+            self._solve_group = None
         self.btn_stop.setEnabled(False)
-        if not self._animating:
-            self._set_controls_enabled(True)
+        self._set_controls_enabled(True)
+        self._sync_tiles_to_state(animate=False)  # laufenden Zug einrasten lassen
         self.status.setText("⏹️ Auto-Lösung gestoppt.")
 
 